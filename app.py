@@ -1,8 +1,9 @@
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, jsonify, request, abort
 from routes.analyze import analyze_bp
 from routes.health import health_bp
 from fake_news_classifier import FakeNewsClassifier
+from static_assets import StaticAssetCache
 from flask_cors import CORS
 import os
 import logging
@@ -10,8 +11,9 @@ import logging
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
-# Create Flask application instance
-app = Flask(__name__, static_folder='dist', static_url_path='')
+# Create Flask application instance.
+# Flask's own static route is disabled; the built frontend is served from StaticAssetCache below.
+app = Flask(__name__, static_folder=None)
 
 # Enable CORS for all
 CORS(app)
@@ -36,22 +38,31 @@ app.config['NEWS_API_URL'] = 'https://newsapi.org/v2/everything'
 app.register_blueprint(health_bp)
 app.register_blueprint(analyze_bp)
 
+# Load and precompress the built frontend once, so serving it never touches the disk.
+static_assets = StaticAssetCache(os.path.join(app.root_path, 'dist'))
+index_asset = static_assets.get('index.html')
+
 @app.route('/')
 def serve_index():
     # Serves the built frontend
-    return send_from_directory(app.static_folder, 'index.html')
+    if index_asset is None:
+        abort(404)
+    return static_assets.response_for(index_asset)
 
 @app.route('/<path:path>')
 def serve_static(path):
     # Serves other static files like CSS, JS, etc.
-    return send_from_directory(app.static_folder, path)
+    asset = static_assets.get(path)
+    if asset is None:
+        abort(404)
+    return static_assets.response_for(asset)
 
 @app.errorhandler(404)
 def not_found(e):
     # Serves the index.html for any path that is not an API route,
     # enabling client-side routing.
-    if not request.path.startswith('/api/'):
-        return send_from_directory(app.static_folder, 'index.html')
+    if not request.path.startswith('/api/') and index_asset is not None:
+        return static_assets.response_for(index_asset)
     return jsonify(error='Not Found'), 404
 
 if __name__ == '__main__':
@@ -0,0 +1,124 @@
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available.
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Vite emits content-hashed bundles such as "assets/index-B1a2c3D4.js".
+HASHED_ASSET_RE = re.compile(r'^assets/.+[-.][A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$')
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json',
+                      'application/xml', 'image/svg+xml', 'application/manifest+json')
+MIN_COMPRESS_SIZE = 1024
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+
+class StaticAsset:
+    """A single file from the build directory, held in memory with its encoded variants."""
+
+    def __init__(self, path, data, mimetype, immutable):
+        self.path = path
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(data).hexdigest()[:16]
+        self.cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        self.variants = {'identity': data}
+
+    def add_variant(self, encoding, data):
+        # Only keep an encoding if it actually saves bytes.
+        if data is not None and len(data) < len(self.variants['identity']):
+            self.variants[encoding] = data
+
+
+class StaticAssetCache:
+    """
+    Loads the built frontend into memory at startup, precompresses it with
+    gzip (and brotli when installed), and serves it with ETag and
+    Cache-Control headers. Files added to the build directory after startup
+    are not picked up until the app restarts.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.assets = {}
+        if not os.path.isdir(root):
+            logger.warning(f"Static folder '{root}' not found; run 'npm run build' to serve the frontend.")
+            return
+        self._load()
+        logger.info(f"Cached {len(self.assets)} static files from '{root}' (brotli {'enabled' if brotli else 'unavailable'}).")
+
+    def _load(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                # Precompressed siblings emitted by the build are attached to their source file below.
+                if filename.endswith(('.gz', '.br')):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(full_path, self.root).replace(os.sep, '/')
+                with open(full_path, 'rb') as f:
+                    data = f.read()
+                self.assets[rel_path] = self._build_asset(full_path, rel_path, data)
+
+    def _build_asset(self, full_path, rel_path, data):
+        mimetype = mimetypes.guess_type(rel_path)[0] or 'application/octet-stream'
+        asset = StaticAsset(rel_path, data, mimetype, bool(HASHED_ASSET_RE.match(rel_path)))
+
+        if len(data) < MIN_COMPRESS_SIZE or not mimetype.startswith(COMPRESSIBLE_TYPES):
+            return asset
+
+        asset.add_variant('gzip', self._read_sibling(full_path + '.gz') or gzip.compress(data, compresslevel=9, mtime=0))
+        brotli_data = self._read_sibling(full_path + '.br')
+        if brotli_data is None and brotli is not None:
+            brotli_data = brotli.compress(data, quality=11)
+        asset.add_variant('br', brotli_data)
+        return asset
+
+    @staticmethod
+    def _read_sibling(path):
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def get(self, path):
+        return self.assets.get(path)
+
+    def response_for(self, asset):
+        """
+        Builds a response for the asset using the best encoding the client
+        accepts, answering conditional requests with 304 Not Modified.
+        """
+        encoding = self._negotiate_encoding(asset)
+        etag = asset.etag if encoding == 'identity' else f"{asset.etag}-{encoding}"
+
+        response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        if len(asset.variants) > 1:
+            response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = asset.cache_control
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+    @staticmethod
+    def _negotiate_encoding(asset):
+        accepted = request.accept_encodings
+        best, best_quality = 'identity', 0
+        for encoding in ('br', 'gzip'):
+            if encoding not in asset.variants:
+                continue
+            quality = accepted[encoding]
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best